@@ -8,65 +8,151 @@ Purpose: Save 10-20 hours per project, prevent $100K+ compliance violations
 import os
 import re
 import json
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from functools import partial
+from typing import Dict, List, Set, Tuple, Optional
+import numpy as np
 import pandas as pd
 from flask import Flask, render_template, request, jsonify, send_file
 from werkzeug.utils import secure_filename
-import PyPDF2
+import fitz
 from io import BytesIO
 
 app = Flask(__name__)
-app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+# Pages to read per drawing once every marking has been found (see
+# ComplianceChecker.page_budget). Unset reads the whole drawing, so a
+# restricted material on any page is still reported
+app.config['PDF_PAGE_BUDGET'] = int(os.environ['PDF_PAGE_BUDGET']) if os.environ.get('PDF_PAGE_BUDGET') else None
 
 # Create necessary directories
-os.makedirs('uploads', exist_ok=True)
 os.makedirs('reports', exist_ok=True)
 
+# pyarrow's multithreaded CSV reader is much faster on large BOMs; fall back
+# to pandas' C parser when it is not installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Same idea for Excel: the Rust-based calamine reader beats pure-Python
+# openpyxl by a wide margin on large .xlsx files
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 class ComplianceChecker:
     """Main compliance validation engine"""
     
-    def __init__(self):
-        self.violations = []
-        self.warnings = []
-        self.risk_score = 0
-        self.checked_items = 0
+    # Drawing keyword sets, checked with plain substring tests against each
+    # page's lowercased text (a fused regex alternation over all of them
+    # turned out several times slower than these 'in' checks)
+    _ITAR_KEYWORDS = (
+        'ITAR', 'export control', 'EAR99', '22 CFR',
+        'International Traffic in Arms', 'export license'
+    )
+    _RESTRICTED_MATERIALS = (
+        'beryllium copper',     # Restricted in crew areas
+        'cadmium',              # Carcinogenic
+        'mercury',              # Toxic
+        'lead',                 # Restricted in many applications
+        'hexavalent chromium',  # Carcinogenic
+        'asbestos'              # Banned in most applications
+    )
+    _TRACEABILITY_KEYWORDS = (
+        'serial number', 'lot number', 'batch',
+        'traceability', 'track', 'S/N', 'L/N'
+    )
+    _ITAR_KEYWORDS_LC = tuple(k.lower() for k in _ITAR_KEYWORDS)
+    _TRACEABILITY_KEYWORDS_LC = tuple(k.lower() for k in _TRACEABILITY_KEYWORDS)
+    
+    # Each page is scanned together with this many characters from the end
+    # of the previous one, so a keyword or 'Rev B' split across a page break
+    # is still found. Comfortably longer than any keyword
+    _PAGE_OVERLAP = 64
+    
+    # Revision/version control markings, matched case-sensitively on raw text
+    _REVISION_RE = re.compile(
+        r'[Rr]ev(?:ision)?\s*[A-Z0-9]+'
+        r'|[Vv]ersion\s*[0-9.]+'
+        r'|[Dd]ate:\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
+    )
+    
+    # Standard BOM column names (adjust based on actual BOMs), lowercased
+    _BOM_COLUMN_NAMES = {
+        'part': ('part number', 'p/n', 'part'),
+        'material': ('material', 'mat', 'composition'),
+        'supplier': ('supplier', 'vendor', 'manufacturer')
+    }
+    
+    # BOM token patterns, matched against uppercased cell values. The short
+    # MS/NAS/AN prefixes only count at the start of a word
+    _ITAR_PART_RE = re.compile(r'MIL-|\bMS|\bNAS|\bAN|CAGE')
+    _RESTRICTED_BOM_MATERIAL_RE = re.compile(
+        r'BERYLLIUM|CADMIUM|MERCURY|LEAD|CHROMIUM VI|ASBESTOS'
+    )
+    
+    # Certified suppliers match on whole words ('BOEING CO' passes,
+    # 'BOEINGLY' does not) - a hash lookup per name token
+    _CERTIFIED_SUPPLIERS = frozenset({
+        'BOEING', 'LOCKHEED', 'RAYTHEON', 'NORTHROP',
+        'HONEYWELL', 'COLLINS', 'PARKER', 'EATON'
+    })
+    _SUPPLIER_TOKEN_SPLIT_RE = re.compile(r'\W+')
+    
+    def __init__(self, page_budget: Optional[int] = None):
+        """
+        Args:
+            page_budget: Once every drawing marking has been found, stop
+                reading after this many pages even if later pages could
+                still mention restricted materials. None reads on until
+                nothing is left to find.
+        """
+        # Configuration only - per-document results live in locals, so one
+        # checker can serve concurrent requests
+        self.page_budget = page_budget
         
-    def validate_document(self, file_path: str, doc_type: str) -> Dict:
+    def validate_document(self, file_path: str, doc_type: str,
+                          data: Optional[bytes] = None) -> Dict:
         """
         Main validation method - delegates to specific validators
         
         Args:
-            file_path: Path to uploaded file
+            file_path: Path to uploaded file, or just its name when data is given
             doc_type: Type of document (drawing, bom, etc.)
+            data: File contents already in memory; parsed directly instead
+                of reading file_path from disk
         
         Returns:
             Compliance report dictionary
         """
-        self.violations = []
-        self.warnings = []
-        self.risk_score = 0
-        
+        violations, warnings, checked_items = [], [], 0
         if doc_type == 'drawing':
-            self._validate_technical_drawing(file_path)
+            violations, warnings, checked_items = self._validate_technical_drawing(file_path, data)
         elif doc_type == 'bom':
-            self._validate_bom(file_path)
-        
-        # Calculate risk score (0-100)
-        self.risk_score = min(100, len(self.violations) * 15 + len(self.warnings) * 5)
+            violations, warnings, checked_items = self._validate_bom(file_path, data)
         
-        return self._generate_report()
+        return self._generate_report(violations, warnings, checked_items)
     
-    def _validate_technical_drawing(self, file_path: str):
-        """Validate PDF technical drawings"""
+    def _validate_technical_drawing(self, file_path: str,
+                                    data: Optional[bytes] = None) -> Tuple[List[Dict], List[Dict], int]:
+        """Validate PDF technical drawings -> (violations, warnings, checked_items)"""
+        violations, warnings = [], []
         try:
-            # Extract text from PDF
-            text = self._extract_pdf_text(file_path)
+            has_itar, restricted_materials, has_revision, has_traceability = \
+                self._scan_drawing(file_path, data)
             
             # Check for ITAR markings
-            if not self._check_itar_marking(text):
-                self.violations.append({
+            if not has_itar:
+                violations.append({
                     'rule': 'ITAR-001',
                     'description': 'Missing ITAR export control statement',
                     'severity': 'HIGH',
@@ -75,9 +161,8 @@ class ComplianceChecker:
                 })
             
             # Check for material compliance
-            restricted_materials = self._check_restricted_materials(text)
             for material in restricted_materials:
-                self.violations.append({
+                violations.append({
                     'rule': 'AS9100-MAT-001',
                     'description': f'Restricted material detected: {material}',
                     'severity': 'HIGH',
@@ -86,8 +171,8 @@ class ComplianceChecker:
                 })
             
             # Check for proper revision control
-            if not self._check_revision_marking(text):
-                self.warnings.append({
+            if not has_revision:
+                warnings.append({
                     'rule': 'AS9100-DOC-002',
                     'description': 'No revision number detected',
                     'severity': 'MEDIUM',
@@ -95,8 +180,8 @@ class ComplianceChecker:
                 })
             
             # Check for traceability requirements
-            if not self._check_traceability(text):
-                self.violations.append({
+            if not has_traceability:
+                violations.append({
                     'rule': 'AS9100-TRACE-001',
                     'description': 'Missing traceability requirements',
                     'severity': 'HIGH',
@@ -104,201 +189,227 @@ class ComplianceChecker:
                 })
                 
         except Exception as e:
-            self.warnings.append({
+            warnings.append({
                 'rule': 'SYSTEM',
                 'description': f'Could not fully parse drawing: {str(e)}',
                 'severity': 'LOW',
                 'fix': 'Manual review recommended'
             })
+        
+        return violations, warnings, 0
     
-    def _validate_bom(self, file_path: str):
-        """Validate Bill of Materials (Excel/CSV)"""
+    def _validate_bom(self, file_path: str,
+                      data: Optional[bytes] = None) -> Tuple[List[Dict], List[Dict], int]:
+        """Validate Bill of Materials (Excel/CSV) -> (violations, warnings, checked_items)"""
+        violations, warnings, checked_items = [], [], 0
         try:
-            # Read BOM file
+            # Resolve the checked columns from the header row alone, then
+            # parse just those columns as strings
+            # In-memory uploads get a fresh buffer per read
+            def source():
+                return file_path if data is None else BytesIO(data)
+            
             if file_path.endswith('.xlsx'):
-                df = pd.read_excel(file_path)
+                header = pd.read_excel(source(), nrows=0, engine=EXCEL_ENGINE)
+                read_bom = partial(pd.read_excel, engine=EXCEL_ENGINE)
             else:
-                df = pd.read_csv(file_path)
+                # The pyarrow engine has no nrows support, so the header read
+                # stays on the default parser
+                header = pd.read_csv(source(), nrows=0)
+                read_bom = partial(pd.read_csv, engine=CSV_ENGINE)
             
-            self.checked_items = len(df)
+            columns = self._map_columns(header.columns)
+            part_col = columns['part']
+            material_col = columns['material']
+            supplier_col = columns['supplier']
             
-            # Standard column names (adjust based on actual BOMs)
-            part_col = self._find_column(df, ['Part Number', 'P/N', 'Part'])
-            material_col = self._find_column(df, ['Material', 'Mat', 'Composition'])
-            supplier_col = self._find_column(df, ['Supplier', 'Vendor', 'Manufacturer'])
+            # Fall back to the first column so row counts survive a BOM with
+            # none of the expected headers
+            usecols = list(dict.fromkeys(
+                col for col in (part_col, material_col, supplier_col) if col
+            )) or header.columns[:1].tolist()
+            df = read_bom(source(), usecols=usecols, dtype='string')
             
-            # Check each part
-            for idx, row in df.iterrows():
-                # Check for ITAR controlled items
-                if part_col and self._is_itar_controlled(str(row.get(part_col, ''))):
-                    self.warnings.append({
-                        'rule': 'ITAR-BOM-001',
-                        'description': f'ITAR controlled part: {row.get(part_col, "Unknown")}',
-                        'severity': 'HIGH',
-                        'fix': 'Ensure proper export licensing',
-                        'location': f'Row {idx + 2}'  # +2 for header and 0-index
-                    })
-                
-                # Check material compliance
-                if material_col and pd.notna(row.get(material_col)):
-                    material = str(row.get(material_col, '')).upper()
-                    if self._is_restricted_material(material):
-                        self.violations.append({
-                            'rule': 'AS9100-MAT-002',
-                            'description': f'Restricted material in BOM: {material}',
-                            'severity': 'HIGH',
-                            'fix': 'Replace with approved material',
-                            'location': f'Row {idx + 2}, Part: {row.get(part_col, "Unknown")}'
-                        })
+            checked_items = len(df)
+            
+            # Run each check over its whole column, then build the entries for
+            # the failing rows in one extend() per check
+            if part_col:
+                part_values = df[part_col].fillna('Unknown').to_numpy(dtype=object)
+                part_upper = df[part_col].str.upper()
                 
-                # Check supplier certification
-                if supplier_col and pd.notna(row.get(supplier_col)):
-                    supplier = str(row.get(supplier_col, ''))
-                    if not self._is_certified_supplier(supplier):
-                        self.warnings.append({
-                            'rule': 'AS9100-SUP-001',
-                            'description': f'Non-certified supplier: {supplier}',
-                            'severity': 'MEDIUM',
-                            'fix': 'Verify AS9100 certification status',
-                            'location': f'Row {idx + 2}'
-                        })
+                # Check for ITAR controlled items
+                itar_mask = part_upper.str.contains(self._ITAR_PART_RE, na=False)
+                warnings.extend({
+                    'rule': 'ITAR-BOM-001',
+                    'description': f'ITAR controlled part: {part_values[i]}',
+                    'severity': 'HIGH',
+                    'fix': 'Ensure proper export licensing',
+                    'location': f'Row {i + 2}'  # +2 for header and 0-index
+                } for i in np.flatnonzero(itar_mask.to_numpy(dtype=bool)))
                 
                 # Check for missing critical data
-                if part_col and pd.isna(row.get(part_col)):
-                    self.violations.append({
-                        'rule': 'AS9100-DATA-001',
-                        'description': 'Missing part number',
-                        'severity': 'HIGH',
-                        'fix': 'All items must have part numbers',
-                        'location': f'Row {idx + 2}'
-                    })
+                violations.extend({
+                    'rule': 'AS9100-DATA-001',
+                    'description': 'Missing part number',
+                    'severity': 'HIGH',
+                    'fix': 'All items must have part numbers',
+                    'location': f'Row {i + 2}'
+                } for i in np.flatnonzero(df[part_col].isna().to_numpy()))
+            else:
+                part_values = np.full(len(df), 'Unknown', dtype=object)
+            
+            # Material and supplier names repeat heavily across a BOM, so each
+            # distinct value is checked once and the verdict mapped back to
+            # its rows through the factorize codes (blank cells are code -1,
+            # which lands on the trailing False)
+            
+            # Check material compliance
+            if material_col:
+                codes, materials = pd.factorize(df[material_col])
+                materials = [m.upper() for m in materials]
+                restricted = np.array([self._is_restricted_material(m) for m in materials] + [False])
+                violations.extend({
+                    'rule': 'AS9100-MAT-002',
+                    'description': f'Restricted material in BOM: {materials[codes[i]]}',
+                    'severity': 'HIGH',
+                    'fix': 'Replace with approved material',
+                    'location': f'Row {i + 2}, Part: {part_values[i]}'
+                } for i in np.flatnonzero(restricted[codes]))
+            
+            # Check supplier certification
+            if supplier_col:
+                codes, suppliers = pd.factorize(df[supplier_col])
+                uncertified = np.array([not self._is_certified_supplier(s) for s in suppliers] + [False])
+                warnings.extend({
+                    'rule': 'AS9100-SUP-001',
+                    'description': f'Non-certified supplier: {suppliers[codes[i]]}',
+                    'severity': 'MEDIUM',
+                    'fix': 'Verify AS9100 certification status',
+                    'location': f'Row {i + 2}'
+                } for i in np.flatnonzero(uncertified[codes]))
                     
         except Exception as e:
-            self.warnings.append({
+            warnings.append({
                 'rule': 'SYSTEM',
                 'description': f'Error processing BOM: {str(e)}',
                 'severity': 'MEDIUM',
                 'fix': 'Check file format and structure'
             })
+        
+        return violations, warnings, checked_items
     
-    def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
+    def _scan_drawing(self, file_path: str,
+                      data: Optional[bytes] = None) -> Tuple[bool, List[str], bool, bool]:
+        """
+        Run the drawing checks page by page, stopping early once every
+        marking is present and no further restricted material can turn up
+        (or page_budget pages have been read)
+        
+        Returns:
+            (has_itar, restricted_materials, has_revision, has_traceability)
+        """
+        has_itar = has_revision = has_traceability = False
+        hits, found = set(), set()
+        tail = ''
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+            pdf = fitz.open(file_path) if data is None else fitz.open(stream=data, filetype='pdf')
+            with pdf as doc:
+                for page_num, page in enumerate(doc, 1):
+                    # Plain "text" mode skips layout analysis - the checks
+                    # only need searchable text
+                    page_text = page.get_text("text")
+                    text = tail + page_text
+                    tail = page_text[-self._PAGE_OVERLAP:]
+                    hits.update(self._scan_keywords(text.lower()))
+                    has_revision = has_revision or self._check_revision_marking(text)
+                    has_itar = 'itar' in hits
+                    has_traceability = 'trace' in hits
+                    found = hits - {'itar', 'trace'}
+                    
+                    if has_itar and has_revision and has_traceability and (
+                        len(found) == len(self._RESTRICTED_MATERIALS)
+                        or (self.page_budget is not None and page_num >= self.page_budget)
+                    ):
+                        break
         except Exception as e:
             raise Exception(f"PDF extraction failed: {str(e)}")
-        return text
-    
-    def _check_itar_marking(self, text: str) -> bool:
-        """Check for required ITAR export control markings"""
-        itar_keywords = [
-            'ITAR', 'export control', 'EAR99', '22 CFR',
-            'International Traffic in Arms', 'export license'
-        ]
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in itar_keywords)
-    
-    def _check_restricted_materials(self, text: str) -> List[str]:
-        """Check for restricted/controlled materials"""
-        restricted = [
-            'beryllium copper',  # Restricted in crew areas
-            'cadmium',          # Carcinogenic
-            'mercury',          # Toxic
-            'lead',             # Restricted in many applications
-            'hexavalent chromium',  # Carcinogenic
-            'asbestos'          # Banned in most applications
-        ]
-        
-        found_materials = []
-        text_lower = text.lower()
-        for material in restricted:
-            if material.lower() in text_lower:
-                found_materials.append(material)
         
-        return found_materials
+        restricted_materials = [m for m in self._RESTRICTED_MATERIALS if m in found]
+        return has_itar, restricted_materials, has_revision, has_traceability
+    
+    def _scan_keywords(self, text_lower: str) -> Set[str]:
+        """
+        Check lowercased text for the ITAR, traceability and restricted
+        material keywords. Returns the tags hit: 'itar', 'trace' and the
+        name of each restricted material found
+        """
+        hits = {m for m in self._RESTRICTED_MATERIALS if m in text_lower}
+        if any(k in text_lower for k in self._ITAR_KEYWORDS_LC):
+            hits.add('itar')
+        if any(k in text_lower for k in self._TRACEABILITY_KEYWORDS_LC):
+            hits.add('trace')
+        return hits
     
     def _check_revision_marking(self, text: str) -> bool:
         """Check for revision/version control markings"""
-        revision_patterns = [
-            r'[Rr]ev[ision]?\s*[A-Z0-9]+',
-            r'[Vv]ersion\s*[0-9.]+',
-            r'[Dd]ate:\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
-        ]
-        
-        for pattern in revision_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        return self._REVISION_RE.search(text) is not None
     
-    def _check_traceability(self, text: str) -> bool:
-        """Check for traceability requirements"""
-        traceability_keywords = [
-            'serial number', 'lot number', 'batch',
-            'traceability', 'track', 'S/N', 'L/N'
-        ]
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in traceability_keywords)
-    
-    def _find_column(self, df: pd.DataFrame, possible_names: List[str]) -> Optional[str]:
-        """Find column by possible names"""
-        for col in df.columns:
-            for name in possible_names:
-                if name.lower() in str(col).lower():
-                    return col
-        return None
+    def _map_columns(self, columns) -> Dict[str, Optional[str]]:
+        """
+        Find the column for each BOM role in a single pass over the header.
+        A column fills a role when one of the role's names appears in it;
+        the first such column wins
+        """
+        mapping = dict.fromkeys(self._BOM_COLUMN_NAMES)
+        for col in columns:
+            col_lower = str(col).lower()
+            for role, names in self._BOM_COLUMN_NAMES.items():
+                if mapping[role] is None and any(name in col_lower for name in names):
+                    mapping[role] = col
+        return mapping
     
     def _is_itar_controlled(self, part_number: str) -> bool:
         """Check if part number indicates ITAR controlled item"""
         # Common ITAR indicators in part numbers
-        itar_indicators = ['MIL-', 'MS', 'NAS', 'AN', 'CAGE']
-        part_upper = part_number.upper()
-        return any(indicator in part_upper for indicator in itar_indicators)
+        return self._ITAR_PART_RE.search(part_number.upper()) is not None
     
     def _is_restricted_material(self, material: str) -> bool:
         """Check if material is restricted"""
-        restricted = [
-            'BERYLLIUM', 'CADMIUM', 'MERCURY', 
-            'LEAD', 'CHROMIUM VI', 'ASBESTOS'
-        ]
-        material_upper = material.upper()
-        return any(rest in material_upper for rest in restricted)
+        return self._RESTRICTED_BOM_MATERIAL_RE.search(material.upper()) is not None
     
     def _is_certified_supplier(self, supplier: str) -> bool:
         """Check if supplier is AS9100 certified (simplified for demo)"""
         # In production, this would check against a database
-        certified_suppliers = [
-            'BOEING', 'LOCKHEED', 'RAYTHEON', 'NORTHROP',
-            'HONEYWELL', 'COLLINS', 'PARKER', 'EATON'
-        ]
-        supplier_upper = supplier.upper()
-        return any(cert in supplier_upper for cert in certified_suppliers)
+        tokens = self._SUPPLIER_TOKEN_SPLIT_RE.split(supplier.upper())
+        return not self._CERTIFIED_SUPPLIERS.isdisjoint(tokens)
     
-    def _generate_report(self) -> Dict:
+    def _generate_report(self, violations: List[Dict], warnings: List[Dict],
+                         checked_items: int) -> Dict:
         """Generate compliance report"""
-        status = 'PASS' if len(self.violations) == 0 else 'FAIL'
+        status = 'PASS' if len(violations) == 0 else 'FAIL'
+        
+        # Calculate risk score (0-100)
+        risk_score = min(100, len(violations) * 15 + len(warnings) * 5)
         
         return {
             'status': status,
-            'risk_score': self.risk_score,
-            'violations': self.violations,
-            'warnings': self.warnings,
-            'checked_items': self.checked_items,
+            'risk_score': risk_score,
+            'violations': violations,
+            'warnings': warnings,
+            'checked_items': checked_items,
             'timestamp': datetime.now().isoformat(),
             'summary': {
-                'total_violations': len(self.violations),
-                'total_warnings': len(self.warnings),
-                'estimated_risk': self._calculate_risk_cost()
+                'total_violations': len(violations),
+                'total_warnings': len(warnings),
+                'estimated_risk': self._calculate_risk_cost(violations, warnings)
             }
         }
     
-    def _calculate_risk_cost(self) -> str:
+    def _calculate_risk_cost(self, violations: List[Dict], warnings: List[Dict]) -> str:
         """Calculate potential cost of non-compliance"""
-        base_cost = len(self.violations) * 50000  # $50K per major violation
-        warning_cost = len(self.warnings) * 5000   # $5K per warning
+        base_cost = len(violations) * 50000  # $50K per major violation
+        warning_cost = len(warnings) * 5000   # $5K per warning
         total = base_cost + warning_cost
         
         if total > 1000000:
@@ -308,8 +419,61 @@ class ComplianceChecker:
         else:
             return "Minimal risk"
 
-# Initialize checker
-checker = ComplianceChecker()
+# Initialize checker - it holds no per-document state, so every worker can
+# share it
+checker = ComplianceChecker(page_budget=app.config['PDF_PAGE_BUDGET'])
+
+# Validation is CPU-bound (PDF/Excel parsing), so it runs in worker processes
+# and the request thread only hands back a job id to poll
+executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+executor_lock = threading.Lock()  # guards swapping in a new pool
+jobs = {}  # job_id -> Future
+finished_at = {}  # job_id -> time.monotonic() when its Future completed
+jobs_lock = threading.Lock()  # Futures complete on the executor's thread
+
+# A result is dropped if nobody polls for it within this many seconds (tab
+# closed, client gave up), so abandoned reports don't pile up in memory
+JOB_RESULT_TTL = 15 * 60
+# Hard cap on tracked jobs; new uploads get a 503 until some are collected
+MAX_JOBS = 1000
+
+def _mark_finished(job_id: str, future) -> None:
+    """Done-callback: start the job's TTL clock (unless it was already collected)"""
+    with jobs_lock:
+        if job_id in jobs:
+            finished_at[job_id] = time.monotonic()
+
+def _evict_stale_jobs() -> None:
+    """Drop finished results that have waited longer than JOB_RESULT_TTL"""
+    cutoff = time.monotonic() - JOB_RESULT_TTL
+    with jobs_lock:
+        for job_id in [j for j, done_at in finished_at.items() if done_at < cutoff]:
+            del finished_at[job_id]
+            jobs.pop(job_id, None)
+
+def _submit_validation(filename: str, doc_type: str, data: bytes):
+    """
+    Queue a validation on the worker pool, or return None if the pool is broken
+    
+    A worker that dies (OOM kill, segfault in a PDF library) leaves the pool
+    unusable for good, so the broken pool is replaced here and the caller
+    answers this one request with a 503
+    """
+    global executor
+    pool = executor
+    try:
+        return pool.submit(run_validation, filename, doc_type, data)
+    except BrokenProcessPool:
+        with executor_lock:
+            # Another request may have replaced it already
+            if executor is pool:
+                executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        pool.shutdown(wait=False)
+        return None
+
+def run_validation(filename: str, doc_type: str, data: bytes) -> Dict:
+    """Validate one in-memory upload in a worker process"""
+    return checker.validate_document(filename, doc_type, data)
 
 @app.route('/')
 def index():
@@ -328,19 +492,43 @@ def validate():
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
     
-    # Save uploaded file
+    # Parse straight from memory - no save/remove round trip through disk
     filename = secure_filename(file.filename)
-    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(filepath)
+    data = file.read()
+    
+    _evict_stale_jobs()
+    with jobs_lock:
+        if len(jobs) >= MAX_JOBS:
+            return jsonify({'error': 'Too many validations in progress, try again shortly'}), 503
+    
+    # Queue validation and return immediately
+    job_id = uuid.uuid4().hex
+    future = _submit_validation(filename, doc_type, data)
+    if future is None:
+        return jsonify({'error': 'Validation workers restarted, try again shortly'}), 503
+    with jobs_lock:
+        jobs[job_id] = future
+    # Added outside the lock - it runs right away if the job already finished
+    future.add_done_callback(partial(_mark_finished, job_id))
+    return jsonify({'job_id': job_id, 'state': 'pending'}), 202
+
+@app.route('/api/validate/<job_id>')
+def validation_result(job_id):
+    """Poll a queued validation - 202 while running, the report once done"""
+    with jobs_lock:
+        future = jobs.get(job_id)
+    if future is None:
+        return jsonify({'error': 'Unknown job id'}), 404
     
-    # Validate document
+    if not future.done():
+        return jsonify({'job_id': job_id, 'state': 'pending'}), 202
+    
+    # Results are handed out once
+    with jobs_lock:
+        jobs.pop(job_id, None)
+        finished_at.pop(job_id, None)
     try:
-        report = checker.validate_document(filepath, doc_type)
-        
-        # Clean up uploaded file
-        os.remove(filepath)
-        
-        return jsonify(report)
+        return jsonify(future.result())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
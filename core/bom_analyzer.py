@@ -3,13 +3,36 @@ BOM Analyzer Module
 YOUR TASK: Implement BOM analysis logic based on your experience with aerospace BOMs
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any
 import re
 
+# Prefer the Rust-based calamine reader; openpyxl is the pure-Python fallback
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 class BOMAnalyzer:
     """Analyze Bill of Materials for compliance issues"""
     
+    # Fields reported for every part, and those that must be filled in
+    PART_FIELDS = ('part_number', 'description', 'quantity', 'material', 'supplier')
+    MANDATORY_FIELDS = ('part_number', 'material', 'supplier')
+    
+    # Part number formats accepted by validate_part_number - add your
+    # company's convention here
+    PART_NUMBER_PATTERNS = (
+        r'^[A-Z]{4}-\d{4}-[A-Z]\d$',  # STRUT-1234-A1
+        r'^MS\d{5}$',                   # MS20995
+        r'^NAS\d{4}$',                  # NAS1234
+        # Add more patterns
+    )
+    # Compiled once into a single alternation - one match call per part
+    _PART_NUMBER_RE = re.compile('|'.join(f'(?:{p})' for p in PART_NUMBER_PATTERNS))
+    
     def __init__(self):
         # YOUR TASK: Add typical BOM column names you see at work
         self.standard_columns = {
@@ -20,6 +43,12 @@ class BOMAnalyzer:
             'supplier': ['Supplier', 'Vendor', 'Manufacturer', 'MFG'],
             # TODO: Add more column variations you encounter
         }
+        # Reverse lookup, built once: lowercased header -> standard name
+        # (standard names map to themselves)
+        self.alias_to_standard = {}
+        for std_col, variations in self.standard_columns.items():
+            for alias in (std_col, *variations):
+                self.alias_to_standard.setdefault(alias.lower(), std_col)
         
     def analyze(self, filepath: str) -> Dict[str, Any]:
         """
@@ -41,38 +70,55 @@ class BOMAnalyzer:
         }
         
         try:
-            # Read Excel file
-            df = pd.read_excel(filepath)
-            extracted_data['total_parts'] = len(df)
+            # Read the header first so only recognised BOM columns get parsed.
+            # Text columns load as strings; quantity keeps numeric inference
+            header = pd.read_excel(filepath, nrows=0, engine=EXCEL_ENGINE)
             
-            # TODO: YOUR CODE HERE
-            # Map columns to standard names
-            # Example:
-            # for std_col, variations in self.standard_columns.items():
-            #     for col in df.columns:
-            #         if col in variations:
-            #             df.rename(columns={col: std_col}, inplace=True)
+            # Map columns to standard names in one pass over the header
+            # (first matching column wins)
+            rename_map = {}
+            for col in header.columns:
+                std_col = self.alias_to_standard.get(str(col).lower())
+                if std_col and std_col not in rename_map.values():
+                    rename_map[col] = std_col
             
-            # TODO: YOUR CODE HERE
-            # Extract parts list with all details
-            # for index, row in df.iterrows():
-            #     part = {
-            #         'row': index + 1,
-            #         'part_number': row.get('part_number', ''),
-            #         'description': row.get('description', ''),
-            #         'quantity': row.get('quantity', 0),
-            #         'material': row.get('material', ''),
-            #         'supplier': row.get('supplier', '')
-            #     }
-            #     extracted_data['parts'].append(part)
+            usecols = list(rename_map) or header.columns[:1].tolist()
+            df = pd.read_excel(
+                filepath,
+                usecols=usecols,
+                engine=EXCEL_ENGINE,
+                dtype={col: 'string' for col, std_col in rename_map.items() if std_col != 'quantity'}
+            )
+            extracted_data['total_parts'] = len(df)
+            df = df.rename(columns=rename_map)
+            
+            # Extract parts list with all details - built column-wise and
+            # converted in one to_dict() call rather than row by row
+            parts = df.reindex(columns=self.PART_FIELDS)
+            parts = parts.fillna({field: (0 if field == 'quantity' else '') for field in self.PART_FIELDS})
+            parts.insert(0, 'row', df.index + 1)
+            extracted_data['parts'] = parts.to_dict(orient='records')
             
-            # TODO: YOUR CODE HERE
             # Check for missing critical data
-            # Which fields are mandatory for compliance?
+            for field in self.MANDATORY_FIELDS:
+                if field not in df.columns:
+                    extracted_data['missing_data'].append({'row': None, 'field': field})
+                    continue
+                extracted_data['missing_data'].extend(
+                    {'row': int(i) + 1, 'field': field}
+                    for i in np.flatnonzero(df[field].isna().to_numpy())
+                )
             
-            # TODO: YOUR CODE HERE
-            # Validate part numbers against aerospace format
-            # Add your company's part numbering convention
+            # Validate part numbers against aerospace format, whole column at once
+            if 'part_number' in df.columns:
+                part_numbers = df['part_number'].astype('string')
+                invalid_mask = part_numbers.notna() & ~part_numbers.str.match(
+                    self._PART_NUMBER_RE, na=False
+                )
+                extracted_data['invalid_parts'].extend({
+                    'row': int(i) + 1,
+                    'part_number': part_numbers.iat[i]
+                } for i in np.flatnonzero(invalid_mask.to_numpy(dtype=bool)))
             
             # Extract unique materials and suppliers
             if 'material' in df.columns:
@@ -107,19 +153,8 @@ class BOMAnalyzer:
         # NAS####
         # AN###
         
-        # TODO: Add your validation patterns
-        patterns = [
-            r'^[A-Z]{4}-\d{4}-[A-Z]\d$',  # STRUT-1234-A1
-            r'^MS\d{5}$',                   # MS20995
-            r'^NAS\d{4}$',                  # NAS1234
-            # Add more patterns
-        ]
-        
         # Check if part number matches any pattern
-        for pattern in patterns:
-            if re.match(pattern, part_number):
-                return True
-        return False
+        return self._PART_NUMBER_RE.match(part_number) is not None
     
     def check_supplier_certification(self, supplier: str) -> Dict[str, Any]:
         """
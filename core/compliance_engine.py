@@ -4,33 +4,50 @@ THIS IS WHERE YOUR EXPERTISE MATTERS MOST!
 Add real compliance rules from your experience at Greenpoint
 """
 
+import copy
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from typing import Dict, List, Any
 
+
 class ComplianceEngine:
     """
     Core engine that checks documents against compliance standards
     """
     
+    # Any of these in a document counts as an export control marking
+    ITAR_MARKERS = ('itar', 'export controlled', 'technical data')
+    
+    # How many check() results to keep, least recently used dropped first
+    CHECK_CACHE_SIZE = 1024
+    
     def __init__(self):
         self.load_rules()
+        self._check_cache = OrderedDict()
         
     def load_rules(self):
-        """Load compliance rules from JSON files"""
-        self.rules = {
-            'as9100': self.load_as9100_rules(),
-            'itar': self.load_itar_rules(),
-            'far': self.load_far_rules()
-        }
+        """
+        Point this engine at the shared rules
+        
+        The rule tables and the scans compiled from them are built once at
+        import (see _ALL_RULES below), so every engine shares one copy
+        instead of rebuilding it. Treat them as read-only
+        """
+        self.rules = _ALL_RULES
+        self.itar_markers, self.itar_keywords, self.itar_split_marker_res = _ITAR_TERMS
+        self.restricted_material_re = _RESTRICTED_MATERIAL_RE
+        self.restricted_by_name = _RESTRICTED_BY_NAME
     
-    def load_as9100_rules(self) -> Dict:
+    @staticmethod
+    def load_as9100_rules() -> Dict:
         """
         AS9100 Quality Management System Requirements
         
         YOUR TASK: Add specific AS9100 rules you know
         """
-        return {
+        rules = {
             'material_requirements': {
                 'restricted_materials': [
                     {
@@ -67,8 +84,15 @@ class ComplianceEngine:
                 # TODO: Add supplier audit requirements
             }
         }
+        
+        # Lowercased once here instead of on every comparison in check_as9100
+        for restricted in rules['material_requirements']['restricted_materials']:
+            restricted['material_lc'] = restricted['material'].lower()
+        
+        return rules
     
-    def load_itar_rules(self) -> Dict:
+    @staticmethod
+    def load_itar_rules() -> Dict:
         """
         ITAR (International Traffic in Arms Regulations) Rules
         
@@ -98,7 +122,8 @@ class ComplianceEngine:
             }
         }
     
-    def load_far_rules(self) -> Dict:
+    @staticmethod
+    def load_far_rules() -> Dict:
         """
         FAR (Federal Acquisition Regulation) Rules
         
@@ -117,12 +142,40 @@ class ComplianceEngine:
             # TODO: Add more FAR requirements
         }
     
+    @staticmethod
+    def build_itar_terms(itar_rules) -> tuple:
+        """
+        Lowercased (markers, keywords, split_marker_res) for check_itar
+        
+        Built once at import so check_itar only has to lower the text and
+        run plain substring checks against them. split_marker_res match the
+        multi-word markers across any whitespace, since extracted PDF text
+        often breaks 'export controlled' across lines - one pattern each, so
+        every search keeps a literal prefix to skip ahead on
+        """
+        markers = tuple(marker.lower() for marker in ComplianceEngine.ITAR_MARKERS)
+        keywords = tuple(keyword.lower() for keyword in itar_rules['export_control']['keywords_to_check'])
+        split_marker_res = tuple(
+            re.compile(re.escape(marker).replace(r'\ ', r'\s+')) for marker in markers if ' ' in marker
+        )
+        return markers, keywords, split_marker_res
+    
     def check(self, data: Dict[str, Any], standard: str) -> Dict[str, List]:
         """
         Main checking function
         
         YOUR TASK: Implement the actual checking logic
+        
+        Results are memoized on a hash of the standard and the fields the
+        checks read, so re-checking the same extracted data is a lookup.
+        If a new check reads another field, add it to _cache_key
         """
+        key = self._cache_key(data, standard)
+        cached = self._check_cache.get(key)
+        if cached is not None:
+            self._check_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+        
         result = {
             'violations': [],
             'warnings': [],
@@ -135,9 +188,41 @@ class ComplianceEngine:
             result = self.check_itar(data)
         elif standard == 'far':
             result = self.check_far(data)
+        
+        # Cache a private copy so callers can't change what later hits get
+        self._check_cache[key] = copy.deepcopy(result)
+        if len(self._check_cache) > self.CHECK_CACHE_SIZE:
+            self._check_cache.popitem(last=False)
             
         return result
     
+    @staticmethod
+    def _cache_key(data: Dict[str, Any], standard: str) -> bytes:
+        """BLAKE2b digest of the standard, raw_text and materials"""
+        digest = hashlib.blake2b(digest_size=16)
+        
+        def add(value: str):
+            # Length-prefixed so field boundaries can't be confused
+            encoded = value.encode('utf-8', 'surrogatepass')
+            digest.update(len(encoded).to_bytes(8, 'little'))
+            digest.update(encoded)
+        
+        add(standard)
+        add(data.get('raw_text') or '')
+        for material in data.get('materials') or ():
+            add(str(material))
+        return digest.digest()
+    
+    def check_batch(self, datas: List[Dict[str, Any]], standard: str) -> List[Dict[str, List]]:
+        """
+        Run check() over many documents
+        
+        Rules and compiled scans are shared module state, so one engine can
+        take a whole batch with no per-file setup
+        """
+        check = self.check
+        return [check(data, standard) for data in datas]
+    
     def check_as9100(self, data: Dict[str, Any]) -> Dict[str, List]:
         """
         Check against AS9100 requirements
@@ -153,22 +238,28 @@ class ComplianceEngine:
         # Check materials
         if 'materials' in data:
             for material in data['materials']:
-                # Check against restricted materials
-                for restricted in rules['material_requirements']['restricted_materials']:
-                    if restricted['material'].lower() in material.lower():
-                        if restricted['severity'] == 'violation':
-                            violations.append({
-                                'type': 'Restricted Material',
-                                'description': f"Found {restricted['material']}: {restricted['restriction']}",
-                                'reference': restricted['reference'],
-                                'location': material
-                            })
-                        else:
-                            warnings.append({
-                                'type': 'Material Warning',
-                                'description': f"Found {restricted['material']}: {restricted['restriction']}",
-                                'reference': restricted['reference']
-                            })
+                # Check against restricted materials - one regex pass finds
+                # every restricted name in the material (each reported once),
+                # then the rule is looked up by name
+                found = dict.fromkeys(
+                    match.group(1).lower()
+                    for match in self.restricted_material_re.finditer(material)
+                )
+                for name in found:
+                    restricted = self.restricted_by_name[name]
+                    if restricted['severity'] == 'violation':
+                        violations.append({
+                            'type': 'Restricted Material',
+                            'description': f"Found {restricted['material']}: {restricted['restriction']}",
+                            'reference': restricted['reference'],
+                            'location': material
+                        })
+                    else:
+                        warnings.append({
+                            'type': 'Material Warning',
+                            'description': f"Found {restricted['material']}: {restricted['restriction']}",
+                            'reference': restricted['reference']
+                        })
         
         # TODO: YOUR CODE HERE
         # Check for supplier certification
@@ -214,23 +305,21 @@ class ComplianceEngine:
         warnings = []
         recommendations = []
         
-        rules = self.rules['itar']
-        
         # Check for export control markings
         if 'raw_text' in data:
             text = data['raw_text'].lower()
             
             # Check if document has required ITAR marking
-            has_itar_marking = any(marker in text for marker in [
-                'itar', 'export controlled', 'technical data'
-            ])
+            # (the whitespace-tolerant searches only run when the plain
+            # substring checks come up empty)
+            has_itar_marking = (
+                any(marker in text for marker in self.itar_markers)
+                or any(pattern.search(text) for pattern in self.itar_split_marker_res)
+            )
             
             if not has_itar_marking:
                 # Check if document contains ITAR keywords
-                contains_itar_content = any(
-                    keyword.lower() in text 
-                    for keyword in rules['export_control']['keywords_to_check']
-                )
+                contains_itar_content = any(keyword in text for keyword in self.itar_keywords)
                 
                 if contains_itar_content:
                     violations.append({
@@ -290,11 +379,29 @@ class ComplianceEngine:
         """
         base_score = 100
         
-        # Deduct points for violations and warnings
-        for violation in violations:
-            base_score -= 15  # Major deduction for violations
-            
-        for warning in warnings:
-            base_score -= 5   # Minor deduction for warnings
+        # Deduct points for violations and warnings - a flat rate each, so
+        # it's just arithmetic on the counts
+        base_score -= 15 * len(violations)  # Major deduction for violations
+        base_score -= 5 * len(warnings)     # Minor deduction for warnings
             
         return max(0, base_score)
+
+
+# Built once per process at import and shared by every ComplianceEngine
+_ALL_RULES = {
+    'as9100': ComplianceEngine.load_as9100_rules(),
+    'itar': ComplianceEngine.load_itar_rules(),
+    'far': ComplianceEngine.load_far_rules()
+}
+_ITAR_TERMS = ComplianceEngine.build_itar_terms(_ALL_RULES['itar'])
+
+# Restricted materials as one case-insensitive alternation. The lookahead
+# keeps matches from consuming text, so names that overlap in a material
+# string are all still found
+_RESTRICTED_BY_NAME = {
+    restricted['material_lc']: restricted
+    for restricted in _ALL_RULES['as9100']['material_requirements']['restricted_materials']
+}
+_RESTRICTED_MATERIAL_RE = re.compile(
+    f"(?=({'|'.join(map(re.escape, _RESTRICTED_BY_NAME))}))", re.IGNORECASE
+)
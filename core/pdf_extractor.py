@@ -3,10 +3,14 @@ PDF Extractor Module
 YOUR TASK: Add extraction logic for technical drawing elements
 """
 
-import PyPDF2
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Dict, List, Any
 
+from .pdf_text import read_pdf
+
 class PDFExtractor:
     """Extract relevant data from technical drawing PDFs"""
     
@@ -25,7 +29,41 @@ class PDFExtractor:
             # TODO: Add more material identifiers you see in drawings
         ]
         
-    def extract(self, filepath: str) -> Dict[str, Any]:
+        # Compiled once per extractor. Each pattern keeps its own scan: the
+        # material patterns run greedily across whitespace and newlines, so
+        # fusing them into one alternation would let one pattern's match
+        # swallow another's (and lose e.g. a MATL: line after Material:)
+        self.part_number_res = self._compile(self.part_number_patterns)
+        self.material_res = self._compile(self.material_patterns)
+        
+        # Materials that are restricted in aerospace, matched as plain text
+        self.restricted_materials = [
+            'beryllium copper',  # Restricted in crew areas
+            'cadmium',          # Environmental concerns
+            'lead',             # REACH compliance
+            # TODO: Add more restricted materials
+        ]
+        self.restricted_material_re = re.compile(
+            '|'.join(map(re.escape, self.restricted_materials)), re.IGNORECASE
+        )
+    
+    @staticmethod
+    def _compile(patterns: List[str]) -> List[re.Pattern]:
+        return [re.compile(p, re.IGNORECASE) for p in patterns]
+    
+    @staticmethod
+    def _find_unique(patterns: List[re.Pattern], text: str) -> List[str]:
+        """
+        Captured value of every match of every pattern, in the order they
+        appear in the text, duplicates dropped
+        """
+        matches = sorted(
+            (match for pattern in patterns for match in pattern.finditer(text)),
+            key=lambda match: match.start()
+        )
+        return list(dict.fromkeys(match.group(1) for match in matches))
+        
+    def extract(self, filepath: str, parallel: bool = True) -> Dict[str, Any]:
         """
         Extract compliance-relevant data from PDF
         
@@ -48,55 +86,58 @@ class PDFExtractor:
         }
         
         try:
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Extract text from all pages
-                full_text = ''
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text = page.extract_text()
-                    full_text += text + '\n'
-                
-                extracted_data['raw_text'] = full_text
-                
-                # Extract part numbers
-                for pattern in self.part_number_patterns:
-                    matches = re.findall(pattern, full_text, re.IGNORECASE)
-                    extracted_data['part_numbers'].extend(matches)
-                
-                # Extract materials
-                for pattern in self.material_patterns:
-                    matches = re.findall(pattern, full_text, re.IGNORECASE)
-                    extracted_data['materials'].extend(matches)
-                
-                # TODO: YOUR CODE HERE
-                # Extract CAGE code (usually 5 characters)
-                # cage_pattern = r'CAGE[\s:]*([A-Z0-9]{5})'
-                # cage_match = re.search(cage_pattern, full_text)
-                # if cage_match:
-                #     extracted_data['cage_code'] = cage_match.group(1)
-                
-                # TODO: YOUR CODE HERE
-                # Extract export control markings (ITAR, EAR, etc.)
-                # Look for phrases like:
-                # - "Export controlled"
-                # - "ITAR restricted"
-                # - "Subject to EAR"
-                
-                # TODO: YOUR CODE HERE  
-                # Extract specifications (MIL-STD, AMS, etc.)
-                # spec_pattern = r'(MIL-STD-\d+|AMS\d+|AS\d+)'
-                
-                # Clean up duplicates
-                extracted_data['part_numbers'] = list(set(extracted_data['part_numbers']))
-                extracted_data['materials'] = list(set(extracted_data['materials']))
-                
+            pages, _ = read_pdf(filepath, parallel=parallel)
+            
+            # Extract text from all pages - joined once rather than
+            # grown with += per page
+            full_text = '\n'.join(pages)
+            
+            extracted_data['raw_text'] = full_text
+            
+            # Extract part numbers - deduplicated as they're collected, so
+            # reports list them in the order they appear on the drawing
+            extracted_data['part_numbers'] = self._find_unique(self.part_number_res, full_text)
+            
+            # Extract materials
+            extracted_data['materials'] = self._find_unique(self.material_res, full_text)
+            
+            # TODO: YOUR CODE HERE
+            # Extract CAGE code (usually 5 characters)
+            # cage_pattern = r'CAGE[\s:]*([A-Z0-9]{5})'
+            # cage_match = re.search(cage_pattern, full_text)
+            # if cage_match:
+            #     extracted_data['cage_code'] = cage_match.group(1)
+            
+            # TODO: YOUR CODE HERE
+            # Extract export control markings (ITAR, EAR, etc.)
+            # Look for phrases like:
+            # - "Export controlled"
+            # - "ITAR restricted"
+            # - "Subject to EAR"
+            
+            # TODO: YOUR CODE HERE  
+            # Extract specifications (MIL-STD, AMS, etc.)
+            # spec_pattern = r'(MIL-STD-\d+|AMS\d+|AS\d+)'
+            
         except Exception as e:
             extracted_data['error'] = str(e)
             
         return extracted_data
     
+    def extract_many(self, filepaths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract a batch of PDFs, results in the same order as filepaths
+        
+        One process pool is opened for the whole batch and files are spread
+        across it; page-level parallelism is switched off inside the workers
+        so they don't each start a pool of their own
+        """
+        if len(filepaths) < 2:
+            return [self.extract(filepath) for filepath in filepaths]
+        
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(filepaths))) as executor:
+            return list(executor.map(partial(self.extract, parallel=False), filepaths))
+    
     def extract_title_block(self, text: str) -> Dict[str, str]:
         """
         Extract information from title block
@@ -122,18 +163,8 @@ class PDFExtractor:
         Check if any materials are restricted
         
         YOUR TASK: Add materials that are restricted in aerospace
+        (self.restricted_materials in __init__)
         """
-        restricted = [
-            'beryllium copper',  # Restricted in crew areas
-            'cadmium',          # Environmental concerns
-            'lead',             # REACH compliance
-            # TODO: Add more restricted materials
-        ]
-        
-        found_restricted = []
-        for material in materials:
-            for restricted_mat in restricted:
-                if restricted_mat.lower() in material.lower():
-                    found_restricted.append(material)
-                    
-        return found_restricted
+        # One search per material; a material naming several restricted
+        # entries is still only reported once
+        return [material for material in materials if self.restricted_material_re.search(material)]
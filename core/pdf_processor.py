@@ -3,11 +3,52 @@ PDF Processor Module
 Handles technical drawing PDFs - extracts text and identifies compliance issues
 """
 
-import PyPDF2
 import re
 from typing import Dict, List
 
+from .pdf_text import read_pdf
+
 class PDFProcessor:
+    # Field patterns, compiled once for every processor instead of on each
+    # extract_* call. Within a field, earlier patterns win.
+    PART_NUMBER_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'P/N[:\s]+([A-Z0-9\-]+)',
+        r'PART NUMBER[:\s]+([A-Z0-9\-]+)',
+        r'PART NO[:\s]+([A-Z0-9\-]+)',
+    ))
+    
+    REVISION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'REV[:\s]+([A-Z0-9]+)',
+        r'REVISION[:\s]+([A-Z0-9]+)',
+    ))
+    
+    MATERIAL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'MATERIAL[:\s]+([^\n]+)',
+        r'MATL[:\s]+([^\n]+)',
+    ))
+    
+    SURFACE_FINISH_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'SURFACE FINISH[:\s]+(\d+)',
+        r'(\d+)\s*Ra',
+        r'(\d+)\s*RMS'
+    ))
+    
+    # Look for tolerance callouts (±0.005, etc.)
+    _TOLERANCE_RE = re.compile(r'[±+-]\d+\.?\d*')
+    
+    EXPORT_KEYWORDS = (
+        'ITAR',
+        'export control',
+        'export restricted',
+        'EAR99',
+        '22 CFR',
+        'arms export control act'
+    )
+    # Lowercased once here; the content is lowered once per check and
+    # searched with plain 'in', which beats an IGNORECASE regex by a wide
+    # margin on big drawings
+    _EXPORT_KEYWORDS_LC = tuple(keyword.lower() for keyword in EXPORT_KEYWORDS)
+    
     def __init__(self):
         self.drawing_requirements = self.load_drawing_requirements()
     
@@ -41,25 +82,15 @@ class PDFProcessor:
     def extract_content(self, filepath: str) -> Dict:
         """Extract text content from PDF technical drawing"""
         try:
-            content = ""
-            metadata = {}
+            # Extract text and metadata (title/author/subject/creator)
+            pages, metadata = read_pdf(filepath)
             
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Extract metadata
-                if pdf_reader.metadata:
-                    metadata = {
-                        'title': pdf_reader.metadata.get('/Title', ''),
-                        'author': pdf_reader.metadata.get('/Author', ''),
-                        'subject': pdf_reader.metadata.get('/Subject', ''),
-                        'creator': pdf_reader.metadata.get('/Creator', '')
-                    }
-                
-                # Extract text from all pages
-                for page_num, page in enumerate(pdf_reader.pages):
-                    page_text = page.extract_text()
-                    content += f"\n--- Page {page_num + 1} ---\n{page_text}"
+            # Extract text from all pages - joined once rather than
+            # grown with += per page
+            content = "".join(
+                f"\n--- Page {page_num + 1} ---\n{text}"
+                for page_num, text in enumerate(pages)
+            )
             
             # Parse drawing information
             parsed_data = self.parse_drawing_content(content)
@@ -77,6 +108,9 @@ class PDFProcessor:
         Parse technical drawing content
         OTHMAN: Add patterns for Greenpoint's drawing standards!
         """
+        # One compiled search per field. A fused lookahead scan was tried
+        # and is far slower: it stops sre skipping ahead on each pattern's
+        # literal prefix, so every branch gets tried at every character
         parsed = {
             'part_number': self.extract_part_number(content),
             'revision': self.extract_revision(content),
@@ -91,83 +125,46 @@ class PDFProcessor:
     
     def extract_part_number(self, content: str) -> str:
         """Extract part number from drawing"""
-        # Common patterns - CUSTOMIZE based on your drawings
-        patterns = [
-            r'P/N[:\s]+([A-Z0-9\-]+)',
-            r'PART NUMBER[:\s]+([A-Z0-9\-]+)',
-            r'PART NO[:\s]+([A-Z0-9\-]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        # Common patterns - CUSTOMIZE PART_NUMBER_PATTERNS based on your drawings
+        for pattern in self.PART_NUMBER_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1)
         return ""
     
     def extract_revision(self, content: str) -> str:
         """Extract revision from drawing"""
-        patterns = [
-            r'REV[:\s]+([A-Z0-9]+)',
-            r'REVISION[:\s]+([A-Z0-9]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in self.REVISION_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1)
         return ""
     
     def extract_material(self, content: str) -> str:
         """Extract material specification"""
-        patterns = [
-            r'MATERIAL[:\s]+([^\n]+)',
-            r'MATL[:\s]+([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in self.MATERIAL_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()
         return ""
     
     def extract_tolerances(self, content: str) -> List[str]:
         """Extract tolerance specifications"""
-        tolerances = []
-        
-        # Look for tolerance callouts (±0.005, etc.)
-        tolerance_pattern = r'[±+-]\d+\.?\d*'
-        matches = re.findall(tolerance_pattern, content)
-        tolerances.extend(matches)
-        
-        return list(set(tolerances))
+        # Unique callouts, in the order they appear
+        return list(dict.fromkeys(self._TOLERANCE_RE.findall(content)))
     
     def extract_surface_finish(self, content: str) -> str:
         """Extract surface finish requirements"""
-        patterns = [
-            r'SURFACE FINISH[:\s]+(\d+)',
-            r'(\d+)\s*Ra',
-            r'(\d+)\s*RMS'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in self.SURFACE_FINISH_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1)
         return ""
     
     def check_export_warning(self, content: str) -> bool:
         """Check if drawing has ITAR/export warning"""
-        export_keywords = [
-            'ITAR',
-            'export control',
-            'export restricted',
-            'EAR99',
-            '22 CFR',
-            'arms export control act'
-        ]
-        
         content_lower = content.lower()
-        return any(keyword in content_lower for keyword in export_keywords)
+        return any(keyword in content_lower for keyword in self._EXPORT_KEYWORDS_LC)
     
     def extract_critical_chars(self, content: str) -> List[str]:
         """
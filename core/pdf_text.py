@@ -0,0 +1,110 @@
+"""
+PDF Text Module
+Page text + metadata extraction shared by PDFExtractor and PDFProcessor
+"""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, List, Tuple
+
+# PyMuPDF does the parsing and font decoding in C (MuPDF) and is many times
+# faster than pure-Python PyPDF2 on big drawing sets; PyPDF2 is only the
+# fallback when it is not installed
+try:
+    import fitz
+    PDF_BACKEND = 'pymupdf'
+except ImportError:
+    import PyPDF2
+    PDF_BACKEND = 'pypdf2'
+
+METADATA_FIELDS = ('title', 'author', 'subject', 'creator')
+
+# Pages are independent, so big drawing packages are split across worker
+# processes. Below this many pages the pool start-up costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 20
+
+
+@contextmanager
+def _open_pypdf2(filepath: str):
+    """
+    PyPDF2 reader over a read-only mmap of the file
+    
+    The reader seeks/reads straight from the mapping (no BytesIO copy), so
+    the kernel only pages in the parts of the PDF that are actually used
+    """
+    with open(filepath, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield PyPDF2.PdfReader(mapped)
+
+
+def _page_text(page) -> str:
+    if PDF_BACKEND == 'pymupdf':
+        # MuPDF ends every page with a newline, PyPDF2 doesn't
+        return page.get_text('text').rstrip('\n')
+    return page.extract_text()
+
+
+def _extract_pages(filepath: str, start: int, stop: int) -> List[str]:
+    """Text of pages [start, stop) - runs in a worker, which opens its own copy"""
+    if PDF_BACKEND == 'pymupdf':
+        with fitz.open(filepath) as pdf:
+            return [_page_text(pdf[page_num]) for page_num in range(start, stop)]
+
+    with _open_pypdf2(filepath) as pdf_reader:
+        return [_page_text(pdf_reader.pages[page_num]) for page_num in range(start, stop)]
+
+
+def _worker_count(page_count: int) -> int:
+    return min(os.cpu_count() or 1, page_count)
+
+
+def _use_parallel(parallel: bool, page_count: int) -> bool:
+    """Worth a pool only for big files and when there's more than one worker to hand pages to"""
+    return parallel and page_count >= PARALLEL_PAGE_THRESHOLD and _worker_count(page_count) > 1
+
+
+def _extract_pages_parallel(filepath: str, page_count: int) -> List[str]:
+    """Split the pages into one contiguous range per worker and stitch the results back in order"""
+    workers = _worker_count(page_count)
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        chunks = executor.map(partial(_extract_pages, filepath), starts, stops)
+        return [text for chunk in chunks for text in chunk]
+
+
+def read_pdf(filepath: str, parallel: bool = True) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Return the text of every page and the document's title block metadata
+
+    Pass parallel=False when the caller is already spreading files over
+    processes itself
+    """
+    if PDF_BACKEND == 'pymupdf':
+        # Opened by path: MuPDF reads the file on demand itself, so there is
+        # nothing to gain from mapping it first
+        with fitz.open(filepath) as pdf:
+            # MuPDF reports every key, empty or not, plus 'format' and
+            # 'encryption' which don't come from the info dict. Only keep
+            # the fields when the file really has info entries (any of
+            # them, e.g. just /Producer), like PyPDF2
+            info = pdf.metadata or {}
+            has_info = any(value for key, value in info.items() if key not in ('format', 'encryption'))
+            metadata = {field: info.get(field) or '' for field in METADATA_FIELDS} if has_info else {}
+            page_count = pdf.page_count
+            if not _use_parallel(parallel, page_count):
+                return [_page_text(page) for page in pdf], metadata
+    else:
+        with _open_pypdf2(filepath) as pdf_reader:
+            info = pdf_reader.metadata
+            metadata = {field: info.get(f'/{field.title()}', '') for field in METADATA_FIELDS} if info else {}
+            page_count = len(pdf_reader.pages)
+            if not _use_parallel(parallel, page_count):
+                return [_page_text(page) for page in pdf_reader.pages], metadata
+
+    return _extract_pages_parallel(filepath, page_count), metadata
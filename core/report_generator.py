@@ -3,12 +3,51 @@ Report Generator Module
 Creates professional compliance reports in multiple formats
 """
 
+import hashlib
 import json
 import os
+import uuid
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Iterable
+
+# orjson's C encoder is several times faster than the stdlib one on big
+# reports; fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(value) -> bytes:
+    """Indented JSON for one value"""
+    if orjson is not None:
+        # NON_STR_KEYS: json turns keys like None/1 into strings, orjson
+        # would raise instead (e.g. a violation with 'type': None)
+        return orjson.dumps(
+            value,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(value, indent=2).encode('utf-8')
+
 
 class ReportGenerator:
+    # Violation type -> recommendations it triggers, in report order
+    RECOMMENDATIONS_BY_TYPE = {
+        'Non-Certified Supplier': (
+            "Implement supplier certification tracking system",
+            "Require AS9100 certification for all aerospace suppliers",
+        ),
+        'Missing Export Control Statement': (
+            "Add ITAR/export control review to document release process",
+            "Train staff on export control requirements",
+        ),
+        'Restricted Material': (
+            "Update approved materials list",
+            "Implement material review board process",
+        ),
+    }
+    
     def __init__(self):
         self.report_dir = 'reports'
         os.makedirs(self.report_dir, exist_ok=True)
@@ -18,14 +57,55 @@ class ReportGenerator:
                      extracted_data: Dict) -> str:
         """Generate comprehensive compliance report"""
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # One clock read for both the filename and generated_at
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         report_name = f"compliance_report_{timestamp}.json"
         report_path = os.path.join(self.report_dir, report_name)
         
+        report = self.build_report(filename, document_type, violations, risk_score,
+                                   extracted_data, now.isoformat())
+        
+        # Save report
+        self.write_report(report_path, report)
+        
+        return report_path
+    
+    def create_batch(self, records: Iterable[Dict]) -> List[str]:
+        """
+        Generate one report per record and return their paths
+        
+        Each record has the create_report arguments as keys (filename,
+        document_type, violations, risk_score, extracted_data). The whole
+        batch shares one timestamp, and files are numbered so reports made
+        in the same second don't overwrite each other
+        """
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        generated_at = now.isoformat()
+        
+        report_paths = []
+        for index, record in enumerate(records, start=1):
+            report_path = os.path.join(self.report_dir, f"compliance_report_{timestamp}_{index:04d}.json")
+            report = self.build_report(record['filename'], record['document_type'],
+                                       record['violations'], record['risk_score'],
+                                       record['extracted_data'], generated_at)
+            self.write_report(report_path, report)
+            report_paths.append(report_path)
+        
+        return report_paths
+    
+    def build_report(self, filename: str, document_type: str,
+                     violations: List[Dict], risk_score: int,
+                     extracted_data: Dict, generated_at: str) -> Dict:
+        """Assemble the report structure for one document"""
+        # One pass over the violations for every severity bucket
+        severity_counts = Counter(v.get('severity') for v in violations)
+        
         # Create report structure
-        report = {
+        return {
             'metadata': {
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': generated_at,
                 'original_file': filename,
                 'document_type': document_type,
                 'analyzer_version': '1.0.0'
@@ -33,38 +113,86 @@ class ReportGenerator:
             'summary': {
                 'risk_score': risk_score,
                 'total_violations': len(violations),
-                'critical_violations': len([v for v in violations if v.get('severity') == 'Critical']),
-                'high_violations': len([v for v in violations if v.get('severity') == 'High']),
-                'medium_violations': len([v for v in violations if v.get('severity') == 'Medium']),
-                'low_violations': len([v for v in violations if v.get('severity') == 'Low'])
+                'critical_violations': severity_counts['Critical'],
+                'high_violations': severity_counts['High'],
+                'medium_violations': severity_counts['Medium'],
+                'low_violations': severity_counts['Low']
             },
             'violations': violations,
             'recommendations': self.generate_recommendations(violations),
             'cost_analysis': self.calculate_cost_impact(violations),
-            'extracted_data': extracted_data
+            'extracted_data': self.compact_extracted_data(extracted_data)
         }
+    
+    @staticmethod
+    def compact_extracted_data(extracted_data: Dict) -> Dict:
+        """
+        Copy of extracted_data with raw_text swapped for its SHA-256 and length
         
-        # Save report
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        The full PDF text can be megabytes and is already in the source
+        document, so reports only carry enough to tell which text was checked
+        """
+        if 'raw_text' not in extracted_data:
+            return extracted_data
         
-        return report_path
+        compact = {key: value for key, value in extracted_data.items() if key != 'raw_text'}
+        raw_text = extracted_data['raw_text'] or ''
+        compact['raw_text_sha256'] = hashlib.sha256(raw_text.encode('utf-8')).hexdigest()
+        compact['raw_text_len'] = len(raw_text)
+        return compact
+    
+    @staticmethod
+    def write_report(path: str, report: Dict) -> None:
+        """
+        Write a report as indented JSON, one piece at a time
+        
+        Top-level sections are encoded separately and the violations list
+        one entry at a time, so a batch run with thousands of violations
+        never holds the whole document as a single string. The file comes
+        out the same as dumping the report in one go
+        
+        It is written to a temp file next to path and moved into place, so
+        a failure part way through never leaves a truncated report behind
+        """
+        # Unique name, so concurrent writers of the same report don't collide
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                ReportGenerator._write_report_body(f, report)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    @staticmethod
+    def _write_report_body(f, report: Dict) -> None:
+        """Stream report into the open binary file f - see write_report"""
+        f.write(b'{')
+        for position, (key, value) in enumerate(report.items()):
+            f.write(b',\n  ' if position else b'\n  ')
+            f.write(_dumps(key) + b': ')
+            
+            if key == 'violations' and isinstance(value, list) and value:
+                f.write(b'[')
+                for index, violation in enumerate(value):
+                    f.write(b',\n    ' if index else b'\n    ')
+                    f.write(_dumps(violation).replace(b'\n', b'\n    '))
+                f.write(b'\n  ]')
+            else:
+                # Nest the section's own indentation one level in
+                f.write(_dumps(value).replace(b'\n', b'\n  '))
+        f.write(b'\n}' if report else b'}')
     
     def generate_recommendations(self, violations: List[Dict]) -> List[str]:
         """Generate actionable recommendations based on violations"""
         recommendations = []
         
-        if any(v.get('type') == 'Non-Certified Supplier' for v in violations):
-            recommendations.append("Implement supplier certification tracking system")
-            recommendations.append("Require AS9100 certification for all aerospace suppliers")
-        
-        if any(v.get('type') == 'Missing Export Control Statement' for v in violations):
-            recommendations.append("Add ITAR/export control review to document release process")
-            recommendations.append("Train staff on export control requirements")
-        
-        if any(v.get('type') == 'Restricted Material' for v in violations):
-            recommendations.append("Update approved materials list")
-            recommendations.append("Implement material review board process")
+        # One pass to collect the types, then a set lookup per known type
+        types_present = {v.get('type') for v in violations}
+        for vtype, type_recommendations in self.RECOMMENDATIONS_BY_TYPE.items():
+            if vtype in types_present:
+                recommendations.extend(type_recommendations)
         
         if not violations:
             recommendations.append("Document is compliant - maintain current processes")
@@ -86,15 +214,15 @@ class ReportGenerator:
         total_risk = 0
         breakdown = {}
         
-        for violation in violations:
-            severity = violation.get('severity', 'Medium')
-            cost = cost_map.get(severity, 5000)
+        # Count each (type, severity) pair in one pass, then cost the pairs
+        # rather than every violation
+        pair_counts = Counter(
+            (v.get('type', 'Other'), v.get('severity', 'Medium')) for v in violations
+        )
+        for (vtype, severity), count in pair_counts.items():
+            cost = cost_map.get(severity, 5000) * count
             total_risk += cost
-            
-            vtype = violation.get('type', 'Other')
-            if vtype not in breakdown:
-                breakdown[vtype] = 0
-            breakdown[vtype] += cost
+            breakdown[vtype] = breakdown.get(vtype, 0) + cost
         
         return {
             'total_potential_cost': total_risk,